@@ -72,6 +72,7 @@ setup(
             "flask>=2.2.0",
             "flask-cors>=4.0.0",
             "gunicorn>=20.1.0",
+            "orjson>=3.8.0",
         ],
         "visualization": [
             "matplotlib>=3.5.0",
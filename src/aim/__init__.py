@@ -34,42 +34,68 @@ __author__ = "jasonviipers"
 __email__ = "support@jasonviipers"
 __license__ = "MIT"
 
-from .api.client import AIMClient
+from typing import TYPE_CHECKING
 
-# API imports
-from .api.server import AIMServer
-from .coordination.collaborator import ConfidenceBasedCollaborator
+from .utils.lazy import lazy_exports
 
-# Coordination imports
-from .coordination.router import CapabilityRouter
-from .core.agent import Agent, AgentCapability
-from .core.context import ContextManager, ContextThread
+if TYPE_CHECKING:
+    from .api.client import AIMClient
+    from .api.server import AIMServer
+    from .coordination.collaborator import ConfidenceBasedCollaborator
+    from .coordination.router import CapabilityRouter
+    from .core.agent import Agent, AgentCapability
+    from .core.context import ContextManager, ContextThread
+    from .core.exceptions import (
+        AgentNotFoundError,
+        AIMException,
+        CapabilityNotAvailableError,
+        ConfigurationError,
+        ContextNotFoundError,
+    )
+    from .core.framework import AIMFramework
+    from .core.request import Request, Response
+    from .knowledge.capsule import KnowledgeCapsule
+    from .knowledge.intent_graph import IntentGraph
+    from .knowledge.propagator import LearningPropagator
+    from .resources.monitor import PerformanceMonitor
+    from .resources.scaler import AdaptiveResourceScaler
+    from .utils.config import Config
+    from .utils.logger import get_logger
 
-# Exception imports
-from .core.exceptions import (
-    AgentNotFoundError,
-    AIMException,
-    CapabilityNotAvailableError,
-    ConfigurationError,
-    ContextNotFoundError,
-)
-
-# Core imports
-from .core.framework import AIMFramework
-from .core.request import Request, Response
-
-# Knowledge management imports
-from .knowledge.capsule import KnowledgeCapsule
-from .knowledge.intent_graph import IntentGraph
-from .knowledge.propagator import LearningPropagator
-from .resources.monitor import PerformanceMonitor
-
-# Resource management imports
-from .resources.scaler import AdaptiveResourceScaler
-
-# Utility imports
-from .utils.config import Config
-from .utils.logger import get_logger
+# Public names and the modules defining them. Importing ``aim`` stays cheap;
+# each module (and dependencies such as Flask) is imported on first access.
+_LAZY_IMPORTS = {
+    # Core classes
+    "AIMFramework": ".core.framework",
+    "Agent": ".core.agent",
+    "AgentCapability": ".core.agent",
+    "ContextThread": ".core.context",
+    "ContextManager": ".core.context",
+    "Request": ".core.request",
+    "Response": ".core.request",
+    # Coordination classes
+    "CapabilityRouter": ".coordination.router",
+    "ConfidenceBasedCollaborator": ".coordination.collaborator",
+    # Resource management classes
+    "AdaptiveResourceScaler": ".resources.scaler",
+    "PerformanceMonitor": ".resources.monitor",
+    # Knowledge management classes
+    "KnowledgeCapsule": ".knowledge.capsule",
+    "LearningPropagator": ".knowledge.propagator",
+    "IntentGraph": ".knowledge.intent_graph",
+    # API classes
+    "AIMServer": ".api.server",
+    "AIMClient": ".api.client",
+    # Utility classes
+    "Config": ".utils.config",
+    "get_logger": ".utils.logger",
+    # Exceptions
+    "AIMException": ".core.exceptions",
+    "AgentNotFoundError": ".core.exceptions",
+    "CapabilityNotAvailableError": ".core.exceptions",
+    "ContextNotFoundError": ".core.exceptions",
+    "ConfigurationError": ".core.exceptions",
+}
 
 __all__ = [
     # Core classes
@@ -104,6 +130,9 @@ __all__ = [
     "ConfigurationError",
 ]
 
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_IMPORTS)
+
+
 # Package metadata
 __package_info__ = {
     "name": "aim-framework",
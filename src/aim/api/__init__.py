@@ -5,10 +5,23 @@ This module provides REST API and client interfaces for
 interacting with the AIM Framework.
 """
 
-from .client import AIMClient
-from .server import AIMServer
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import AIMClient
+    from .server import AIMServer
+
+# Public names and the submodules defining them, imported on first access
+_LAZY_IMPORTS = {
+    "AIMServer": ".server",
+    "AIMClient": ".client",
+}
 
 __all__ = [
     "AIMServer",
     "AIMClient",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_IMPORTS)
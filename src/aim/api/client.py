@@ -8,9 +8,18 @@ the AIM Framework REST API.
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Headers sent with request bodies that are pre-encoded with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class AIMClient:
     """
@@ -20,19 +29,31 @@ class AIMClient:
     and retrieving metrics from a remote AIM Framework instance.
     """
 
-    def __init__(self, base_url: str = "http://localhost:5000", timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:5000",
+        timeout: float = 30.0,
+        pool_maxsize: int = 64,
+    ):
         """
         Initialize the AIM client.
 
         Args:
             base_url: Base URL of the AIM Framework API
             timeout: Request timeout in seconds
+            pool_maxsize: Maximum number of connections kept open per host
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.logger = get_logger(__name__)
         self.session = requests.Session()
 
+        # Size the connection pool so concurrent callers reuse connections
+        # instead of discarding them once the default pool of 10 is full
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check the health of the AIM Framework server.
@@ -45,7 +66,7 @@ class AIMClient:
         """
         response = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
 
     def process_request(
         self,
@@ -91,11 +112,9 @@ class AIMClient:
         if metadata is not None:
             data["metadata"] = metadata
 
-        response = self.session.post(
-            f"{self.base_url}/process", json=data, timeout=self.timeout
-        )
+        response = self._post_json(f"{self.base_url}/process", data)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
 
     def list_agents(self) -> List[Dict[str, Any]]:
         """
@@ -109,7 +128,7 @@ class AIMClient:
         """
         response = self.session.get(f"{self.base_url}/agents", timeout=self.timeout)
         response.raise_for_status()
-        return response.json()["agents"]
+        return self._decode(response)["agents"]
 
     def get_agent(self, agent_id: str) -> Dict[str, Any]:
         """
@@ -128,7 +147,7 @@ class AIMClient:
             f"{self.base_url}/agents/{agent_id}", timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json().get("agent", {})
+        return self._decode(response).get("agent", {})
 
     def create_context_thread(
         self, user_id: str, initial_context: Optional[Dict[str, Any]] = None
@@ -151,11 +170,9 @@ class AIMClient:
         if initial_context is not None:
             data["initial_context"] = initial_context
 
-        response = self.session.post(
-            f"{self.base_url}/context", json=data, timeout=self.timeout
-        )
+        response = self._post_json(f"{self.base_url}/context", data)
         response.raise_for_status()
-        return response.json()["thread_id"]
+        return self._decode(response)["thread_id"]
 
     def get_context_thread(self, thread_id: str) -> Dict[str, Any]:
         """
@@ -174,7 +191,7 @@ class AIMClient:
             f"{self.base_url}/context/{thread_id}", timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
 
     def get_user_context_threads(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -193,7 +210,7 @@ class AIMClient:
             f"{self.base_url}/users/{user_id}/contexts", timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json()["contexts"]
+        return self._decode(response)["contexts"]
 
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
@@ -207,7 +224,7 @@ class AIMClient:
         """
         response = self.session.get(f"{self.base_url}/metrics", timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
 
     def get_framework_status(self) -> Dict[str, Any]:
         """
@@ -221,7 +238,7 @@ class AIMClient:
         """
         response = self.session.get(f"{self.base_url}/status", timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
 
     def get_intent_predictions(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -240,7 +257,61 @@ class AIMClient:
             f"{self.base_url}/intents/{user_id}/predictions", timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json()["predictions"]
+        return self._decode(response)["predictions"]
+
+    def _post_json(self, url: str, data: Dict[str, Any]) -> requests.Response:
+        """
+        POST a JSON body, encoding it with orjson when available.
+
+        Non-string dictionary keys are sent as strings, as with ``json=``.
+        Unlike ``json=``, orjson encodes NaN and infinity as ``null``
+        instead of rejecting them.
+
+        Args:
+            url: Target URL
+            data: Request body
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.exceptions.InvalidJSONError: If the body cannot be encoded
+        """
+        if orjson is None:
+            return self.session.post(url, json=data, timeout=self.timeout)
+
+        try:
+            body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            raise requests.exceptions.InvalidJSONError(e) from e
+
+        return self.session.post(
+            url, data=body, headers=JSON_HEADERS, timeout=self.timeout
+        )
+
+    @staticmethod
+    def _decode(response: requests.Response) -> Any:
+        """
+        Decode a JSON response body, using orjson when available.
+
+        Args:
+            response: HTTP response to decode
+
+        Returns:
+            Any: Decoded response body
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON
+        """
+        if orjson is None:
+            return response.json()
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Keep the same error type as response.json() so callers catching
+            # requests.RequestException still handle it
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
 
     def close(self) -> None:
         """Close the client session."""
@@ -6,15 +6,61 @@ the AIM Framework remotely.
 """
 
 import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Coroutine, Dict, Optional, Tuple
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 from ..core.framework import AIMFramework
-from ..core.request import Priority, Request
+from ..core.request import Priority, Request, RequestStatus
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Fields that must be present in a /process request body
+PROCESS_REQUIRED_FIELDS = ("user_id", "content", "task_type")
+
+# Extra time the /process route waits beyond the request timeout, which the
+# framework enforces itself (seconds)
+PROCESS_TIMEOUT_GRACE = 1.0
+
+# How long a serialized /health response is reused (seconds)
+HEALTH_CACHE_TTL = 1.0
+
+# How long a serialized /agents response is reused (seconds)
+AGENTS_CACHE_TTL = 1.0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Used for jsonify() and request body decoding when orjson is installed.
+    Values orjson cannot encode natively fall back to Flask's default
+    conversions.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON."""
+        body: bytes = orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        return body.decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize data as JSON."""
+        return orjson.loads(s)
+
 
 class AIMServer:
     """
@@ -34,23 +80,41 @@ class AIMServer:
         self.config = config
         self.logger = get_logger(__name__)
 
+        # Server configuration
+        self.host = config.get("api.host", "0.0.0.0")
+        self.port = config.get("api.port", 5000)
+        self.debug = config.get("api.debug", False)
+        self.cors_enabled = config.get("api.cors_enabled", True)
+        self.allowed_origins = config.get("security.allowed_origins", ["*"])
+
         # Create Flask app
         self.app = Flask(__name__)
+        if orjson is not None:
+            self.app.json = OrjsonProvider(self.app)
 
         # Enable CORS if configured
-        if config.get("api.cors_enabled", True):
-            CORS(self.app, origins=config.get("security.allowed_origins", ["*"]))
+        if self.cors_enabled:
+            CORS(self.app, origins=self.allowed_origins)
 
         # Initialize framework
         self.framework = AIMFramework(config)
 
-        # Setup routes
-        self._setup_routes()
+        # Persistent event loop shared by all request threads
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="aim-server-loop", daemon=True
+        )
+        self._loop_thread.start()
 
-        # Server configuration
-        self.host = config.get("api.host", "0.0.0.0")
-        self.port = config.get("api.port", 5000)
-        self.debug = config.get("api.debug", False)
+        # Serialized /health body and the monotonic time it was built
+        self._health_cache: Optional[Tuple[float, str]] = None
+
+        # Serialized /agents body, the build time and the registry version it covers
+        self._agents_cache: Optional[Tuple[float, int, str]] = None
+
+        # Setup routes and build the URL map now rather than on first request
+        self._setup_routes()
+        self.app.url_map.update()
 
     def _setup_routes(self) -> None:
         """Setup Flask routes."""
@@ -58,26 +122,35 @@ class AIMServer:
         @self.app.route("/health", methods=["GET"])
         def health_check():
             """Health check endpoint."""
-            return jsonify(
-                {
-                    "status": "healthy",
-                    "framework_initialized": self.framework.is_initialized,
-                    "timestamp": self.framework.get_framework_status(),
-                }
-            )
+            now = time.monotonic()
+            cached = self._health_cache
+
+            if cached is None or now - cached[0] >= HEALTH_CACHE_TTL:
+                body = self.app.json.dumps(
+                    {
+                        "status": "healthy",
+                        "framework_initialized": self.framework.is_initialized,
+                        "timestamp": self._call_in_loop(
+                            self.framework.get_framework_status
+                        ),
+                    }
+                )
+                cached = (now, body)
+                self._health_cache = cached
+
+            return self.app.response_class(cached[1], mimetype="application/json")
 
         @self.app.route("/process", methods=["POST"])
         def process_request():
             """Process a request through the framework."""
             try:
-                data = request.get_json()
+                data = self._get_json_body()
 
                 if not data:
                     return jsonify({"error": "No JSON data provided"}), 400
 
                 # Validate required fields
-                required_fields = ["user_id", "content", "task_type"]
-                for field in required_fields:
+                for field in PROCESS_REQUIRED_FIELDS:
                     if field not in data:
                         return (
                             jsonify({"error": f"Missing required field: {field}"}),
@@ -95,16 +168,21 @@ class AIMServer:
                     metadata=data.get("metadata", {}),
                 )
 
-                # Process request asynchronously
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    response = loop.run_until_complete(
-                        self.framework.process_request(aim_request)
-                    )
-                    return jsonify(response.to_dict())
-                finally:
-                    loop.close()
+                # Process request on the background event loop
+                response = self._run_async(
+                    self.framework.process_request(aim_request),
+                    timeout=aim_request.timeout + PROCESS_TIMEOUT_GRACE,
+                )
+
+                if aim_request.status == RequestStatus.TIMEOUT:
+                    return jsonify(response.to_dict()), 504
+
+                return jsonify(response.to_dict())
+
+            except concurrent.futures.TimeoutError:
+                error_message = f"Request timed out after {aim_request.timeout} seconds"
+                self.logger.error(f"Error processing request: {error_message}")
+                return jsonify({"error": error_message}), 504
 
             except Exception as e:
                 self.logger.error(f"Error processing request: {e}")
@@ -114,8 +192,24 @@ class AIMServer:
         def list_agents():
             """List all registered agents."""
             try:
-                agents = self.framework.list_agents()
-                return jsonify({"agents": agents})
+                now = time.monotonic()
+                agents_version = self.framework.agents_version
+                cached = self._agents_cache
+
+                if (
+                    cached is None
+                    or now - cached[0] >= AGENTS_CACHE_TTL
+                    or cached[1] != agents_version
+                ):
+                    agents = self._call_in_loop(self.framework.list_agents)
+                    cached = (
+                        now,
+                        agents_version,
+                        self.app.json.dumps({"agents": agents}),
+                    )
+                    self._agents_cache = cached
+
+                return self.app.response_class(cached[2], mimetype="application/json")
             except Exception as e:
                 self.logger.error(f"Error listing agents: {e}")
                 return jsonify({"error": str(e)}), 500
@@ -124,8 +218,10 @@ class AIMServer:
         def get_agent(agent_id: str):
             """Get information about a specific agent."""
             try:
-                agent = self.framework.get_agent(agent_id)
-                return jsonify(agent.get_info())
+                agent_info = self._call_in_loop(
+                    lambda: self.framework.get_agent(agent_id).get_info()
+                )
+                return jsonify(agent_info)
             except Exception as e:
                 self.logger.error(f"Error getting agent {agent_id}: {e}")
                 return jsonify({"error": str(e)}), 404
@@ -134,23 +230,18 @@ class AIMServer:
         def create_context():
             """Create a new context thread."""
             try:
-                data = request.get_json()
+                data = self._get_json_body()
 
                 if not data or "user_id" not in data:
                     return jsonify({"error": "user_id is required"}), 400
 
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    thread_id = loop.run_until_complete(
-                        self.framework.create_context_thread(
-                            user_id=data["user_id"],
-                            initial_context=data.get("initial_context"),
-                        )
+                thread_id = self._run_async(
+                    self.framework.create_context_thread(
+                        user_id=data["user_id"],
+                        initial_context=data.get("initial_context"),
                     )
-                    return jsonify({"thread_id": thread_id})
-                finally:
-                    loop.close()
+                )
+                return jsonify({"thread_id": thread_id})
 
             except Exception as e:
                 self.logger.error(f"Error creating context: {e}")
@@ -160,8 +251,14 @@ class AIMServer:
         def get_context(thread_id: str):
             """Get a context thread."""
             try:
-                context = self.framework.get_context_thread(thread_id)
-                return jsonify(context)
+                # Serialize on the loop too, since the thread dict shares the
+                # live shared_context mapping
+                body = self._call_in_loop(
+                    lambda: self.app.json.dumps(
+                        self.framework.get_context_thread(thread_id)
+                    )
+                )
+                return self.app.response_class(body, mimetype="application/json")
             except Exception as e:
                 self.logger.error(f"Error getting context {thread_id}: {e}")
                 return jsonify({"error": str(e)}), 404
@@ -170,7 +267,9 @@ class AIMServer:
         def get_user_contexts(user_id: str):
             """Get all context threads for a user."""
             try:
-                contexts = self.framework.get_user_context_threads(user_id)
+                contexts = self._call_in_loop(
+                    self.framework.get_user_context_threads, user_id
+                )
                 return jsonify({"contexts": contexts})
             except Exception as e:
                 self.logger.error(f"Error getting contexts for user {user_id}: {e}")
@@ -180,15 +279,8 @@ class AIMServer:
         def get_metrics():
             """Get performance metrics."""
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    metrics = loop.run_until_complete(
-                        self.framework.get_performance_metrics()
-                    )
-                    return jsonify(metrics)
-                finally:
-                    loop.close()
+                metrics = self._run_async(self.framework.get_performance_metrics())
+                return jsonify(metrics)
 
             except Exception as e:
                 self.logger.error(f"Error getting metrics: {e}")
@@ -198,7 +290,7 @@ class AIMServer:
         def get_status():
             """Get framework status."""
             try:
-                status = self.framework.get_framework_status()
+                status = self._call_in_loop(self.framework.get_framework_status)
                 return jsonify(status)
             except Exception as e:
                 self.logger.error(f"Error getting status: {e}")
@@ -208,15 +300,10 @@ class AIMServer:
         def get_intent_predictions(user_id: str):
             """Get intent predictions for a user."""
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    predictions = loop.run_until_complete(
-                        self.framework.get_intent_predictions(user_id)
-                    )
-                    return jsonify({"predictions": predictions})
-                finally:
-                    loop.close()
+                predictions = self._run_async(
+                    self.framework.get_intent_predictions(user_id)
+                )
+                return jsonify({"predictions": predictions})
 
             except Exception as e:
                 self.logger.error(
@@ -224,10 +311,99 @@ class AIMServer:
                 )
                 return jsonify({"error": str(e)}), 500
 
-    async def run(self) -> None:
-        """Run the server."""
-        # Initialize framework
-        await self.framework.initialize()
+    def _get_json_body(self) -> Optional[Dict[str, Any]]:
+        """
+        Decode the JSON body of the current request.
+
+        The raw body is decoded with the app's JSON provider and is not kept
+        on the request object after decoding.
+
+        Returns:
+            Optional[Dict[str, Any]]: Decoded body, or None if empty or invalid
+        """
+        raw = request.get_data(cache=False)
+        if not raw:
+            return None
+
+        try:
+            data = self.app.json.loads(raw)
+        except ValueError:
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    def _run_async(
+        self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Run a coroutine on the server's background event loop.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Maximum time to wait for the result (seconds)
+
+        Returns:
+            Any: Result of the coroutine
+
+        Raises:
+            concurrent.futures.TimeoutError: If the coroutine does not finish in time
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _call_in_loop(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a synchronous function on the server's background event loop.
+
+        Framework state is mutated by tasks on the loop thread, so reads from
+        request threads are run there as well.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for the function
+
+        Returns:
+            Any: Return value of the function
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def call() -> None:
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._loop.call_soon_threadsafe(call)
+        return future.result()
+
+    async def _cancel_pending_tasks(self) -> None:
+        """Cancel tasks still running on the background event loop."""
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def initialize(self) -> None:
+        """
+        Initialize the framework on the background event loop.
+
+        Does nothing if the framework is already initialized, so the WSGI
+        factory and run() can both call it safely.
+        """
+        if self.framework.is_initialized:
+            return
+
+        self._run_async(self.framework.initialize())
+
+    def run(self) -> None:
+        """Run the server using the Flask development server."""
+        self.initialize()
 
         self.logger.info(f"Starting AIM server on {self.host}:{self.port}")
 
@@ -241,6 +417,18 @@ class AIMServer:
         except Exception as e:
             self.logger.error(f"Server error: {e}")
         finally:
-            # Shutdown framework
-            await self.framework.shutdown()
+            self.shutdown()
             self.logger.info("Server shutdown complete")
+
+    def shutdown(self) -> None:
+        """Shutdown the framework and stop the background event loop."""
+        if self._loop.is_closed():
+            return
+
+        try:
+            self._run_async(self.framework.shutdown())
+            self._run_async(self._cancel_pending_tasks())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
@@ -0,0 +1,61 @@
+"""
+WSGI entry point for the AIM Framework API server.
+
+This module exposes the Flask application for production WSGI servers
+such as Gunicorn:
+
+    gunicorn --workers 4 --threads 8 --bind 0.0.0.0:5000 aim.api.wsgi:application
+
+Each worker creates its own server and background event loop, so the
+application must not be preloaded in the master process (no ``--preload``).
+The configuration file can be selected with the ``AIM_CONFIG_FILE``
+environment variable. The framework is shut down when the worker exits.
+"""
+
+import atexit
+import gc
+import os
+from typing import Optional
+
+from flask import Flask
+
+from ..utils.config import Config
+from ..utils.logger import setup_logging
+from .server import AIMServer
+
+
+def create_app(config_file: Optional[str] = None) -> Flask:
+    """
+    Create the Flask application with an initialized framework.
+
+    Args:
+        config_file: Path to a JSON configuration file
+
+    Returns:
+        Flask: The configured Flask application
+    """
+    config = Config(config_file)
+
+    setup_logging(
+        level=config.get("logging.level", "INFO"),
+        format_string=config.get("logging.format"),
+        log_file=config.get("logging.file"),
+        max_file_size=config.get("logging.max_file_size", 10485760),
+        backup_count=config.get("logging.backup_count", 5),
+    )
+
+    server = AIMServer(config)
+    server.initialize()
+
+    # Shut the framework down when the worker process exits, as run() does
+    atexit.register(server.shutdown)
+
+    # Move the long-lived startup heap out of the collector's generations so
+    # later collections only scan objects created while serving requests
+    gc.collect()
+    gc.freeze()
+
+    return server.app
+
+
+application = create_app(os.getenv("AIM_CONFIG_FILE"))
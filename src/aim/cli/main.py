@@ -11,7 +11,6 @@ import json
 import sys
 from pathlib import Path
 
-from ..api.server import AIMServer
 from ..utils.config import Config
 from ..utils.logger import get_logger, setup_logging
 
@@ -71,10 +70,13 @@ def start_server() -> None:
             logger.error(f"  - {error}")
         sys.exit(1)
 
+    # Import server module (pulls in Flask and the full framework)
+    from ..api.server import AIMServer
+
     # Create and start server
     try:
         server = AIMServer(config)
-        asyncio.run(server.run())
+        server.run()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Set
 
 from ..core.agent import Agent, AgentStatus
 from ..core.exceptions import CapabilityNotAvailableError
-from ..core.request import Request
+from ..core.request import PRIORITY_VALUES, Request
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
@@ -45,7 +45,8 @@ class CapabilityRouter:
         Args:
             agents: Dictionary of available agents
         """
-        self.agents = agents
+        # Keep a separate mapping; add_agent/remove_agent maintain it
+        self.agents = dict(agents)
         self._build_capability_map()
         self.logger.info("Capability router initialized")
 
@@ -242,7 +243,7 @@ class CapabilityRouter:
         Returns:
             str: Cache key
         """
-        return f"{request.task_type}:{request.priority.value}"
+        return f"{request.task_type}:{PRIORITY_VALUES[request.priority]}"
 
     def _validate_route(self, route: List[str]) -> bool:
         """
@@ -9,17 +9,40 @@ This module contains the fundamental components of the AIM Framework:
 - Exceptions: Framework-specific exceptions
 """
 
-from .agent import Agent, AgentCapability, AgentStatus
-from .context import ContextManager, ContextThread
-from .exceptions import (
-    AgentNotFoundError,
-    AIMException,
-    CapabilityNotAvailableError,
-    ConfigurationError,
-    ContextNotFoundError,
-)
-from .framework import AIMFramework
-from .request import Request, RequestStatus, Response
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent import Agent, AgentCapability, AgentStatus
+    from .context import ContextManager, ContextThread
+    from .exceptions import (
+        AgentNotFoundError,
+        AIMException,
+        CapabilityNotAvailableError,
+        ConfigurationError,
+        ContextNotFoundError,
+    )
+    from .framework import AIMFramework
+    from .request import Request, RequestStatus, Response
+
+# Public names and the submodules defining them, imported on first access
+_LAZY_IMPORTS = {
+    "AIMFramework": ".framework",
+    "Agent": ".agent",
+    "AgentCapability": ".agent",
+    "AgentStatus": ".agent",
+    "ContextThread": ".context",
+    "ContextManager": ".context",
+    "Request": ".request",
+    "Response": ".request",
+    "RequestStatus": ".request",
+    "AIMException": ".exceptions",
+    "AgentNotFoundError": ".exceptions",
+    "CapabilityNotAvailableError": ".exceptions",
+    "ContextNotFoundError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+}
 
 __all__ = [
     "AIMFramework",
@@ -37,3 +60,5 @@ __all__ = [
     "ContextNotFoundError",
     "ConfigurationError",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_IMPORTS)
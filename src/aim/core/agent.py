@@ -28,6 +28,9 @@ class AgentStatus(Enum):
     ERROR = "error"
 
 
+AGENT_STATUS_VALUES = {status: status.value for status in AgentStatus}
+
+
 class AgentCapability(Enum):
     """Enumeration of agent capabilities."""
 
@@ -54,6 +57,9 @@ class AgentCapability(Enum):
     ROBOTICS = "robotics"
 
 
+CAPABILITY_VALUES = {capability: capability.value for capability in AgentCapability}
+
+
 @dataclass
 class AgentMetrics:
     """Metrics for tracking agent performance."""
@@ -295,8 +301,8 @@ class Agent(ABC):
         """
         return {
             "agent_id": self.agent_id,
-            "capabilities": [cap.value for cap in self.capabilities],
-            "status": self.status.value,
+            "capabilities": [CAPABILITY_VALUES[cap] for cap in self.capabilities],
+            "status": AGENT_STATUS_VALUES[self.status],
             "description": self.description,
             "version": self.version,
             "created_at": self.created_at,
@@ -61,6 +61,8 @@ class AIMFramework:
 
         # Core components
         self.agents: Dict[str, Agent] = {}
+        # Incremented whenever an agent is registered or deregistered
+        self.agents_version = 0
         self.context_manager = ContextManager(
             max_threads_per_user=self.config.get("context.max_threads_per_user", 10),
             cleanup_interval=self.config.get("context.cleanup_interval", 3600.0),
@@ -82,8 +84,16 @@ class AIMFramework:
         self.is_initialized = False
         self._shutdown_event = asyncio.Event()
 
+        # Background task intervals
+        self.cleanup_interval = self.config.get("framework.cleanup_interval", 300.0)
+        self.monitoring_interval = self.config.get(
+            "monitoring.collection_interval", 60.0
+        )
+        self.scaling_interval = self.config.get("scaling.evaluation_interval", 30.0)
+
         # Set start time
-        self.config.set("framework.start_time", time.time())
+        self.start_time = time.time()
+        self.config.set("framework.start_time", self.start_time)
 
         self.logger.info("AIM Framework initialized")
 
@@ -159,6 +169,7 @@ class AIMFramework:
             raise AIMException(f"Agent {agent.agent_id} is already registered")
 
         self.agents[agent.agent_id] = agent
+        self.agents_version += 1
         self.router.add_agent(agent)
         self.scaler.register_agent(agent)
 
@@ -184,6 +195,7 @@ class AIMFramework:
         self.scaler.deregister_agent(agent_id)
 
         del self.agents[agent_id]
+        self.agents_version += 1
 
         self.logger.info(f"Deregistered agent: {agent_id}")
 
@@ -234,7 +246,7 @@ class AIMFramework:
         if not self.is_initialized:
             raise AIMException("Framework not initialized. Call initialize() first.")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         request.set_status(RequestStatus.ROUTING)
 
         try:
@@ -242,34 +254,14 @@ class AIMFramework:
                 f"Processing request {request.request_id} from user {request.user_id}"
             )
 
-            # Update intent graph
-            await self.intent_graph.add_intent(request)
-
-            # Route the request to appropriate agents
-            agent_path = await self.router.route_request(request)
-
-            if not agent_path:
-                raise CapabilityNotAvailableError(request.task_type)
-
-            request.set_status(RequestStatus.PROCESSING)
-
-            # Process through agent collaboration
-            response = await self.collaborator.process_with_collaboration(
-                request, agent_path
+            # Enforce the request timeout here so timed-out requests are
+            # still recorded by the monitor
+            response = await asyncio.wait_for(
+                self._execute_request(request), timeout=request.timeout
             )
 
-            # Update context if thread ID is provided
-            if request.context_thread_id:
-                try:
-                    await self._update_context_thread(request, response)
-                except Exception as e:
-                    self.logger.warning(f"Failed to update context thread: {e}")
-
-            # Propagate learning
-            await self.propagator.propagate_learning(response)
-
             # Update performance metrics
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             await self.monitor.record_request(request, response, processing_time)
 
             request.set_status(RequestStatus.COMPLETED)
@@ -280,24 +272,103 @@ class AIMFramework:
 
             return response
 
-        except Exception as e:
-            processing_time = time.time() - start_time
-            request.set_status(RequestStatus.FAILED)
+        except asyncio.TimeoutError as e:
+            # Only the request deadline counts as a request timeout; timeouts
+            # raised by agents or I/O before it are ordinary failures
+            elapsed = time.perf_counter() - start_time
+            if request.timeout is None or elapsed < request.timeout:
+                return await self._fail_request(
+                    request, str(e), start_time, RequestStatus.FAILED
+                )
 
-            self.logger.error(f"Failed to process request {request.request_id}: {e}")
+            return await self._fail_request(
+                request,
+                f"Request timed out after {request.timeout} seconds",
+                start_time,
+                RequestStatus.TIMEOUT,
+            )
 
-            # Create error response
-            response = Response.create_error_response(
-                request_id=request.request_id,
-                agent_id="framework",
-                error_message=str(e),
-                processing_time=processing_time,
+        except Exception as e:
+            return await self._fail_request(
+                request, str(e), start_time, RequestStatus.FAILED
             )
 
-            # Still record metrics for failed requests
-            await self.monitor.record_request(request, response, processing_time)
+    async def _execute_request(self, request: Request) -> Response:
+        """
+        Route a request and process it through agent collaboration.
 
-            return response
+        Args:
+            request: The request to process
+
+        Returns:
+            Response: The response from the collaborating agents
+        """
+        # Update intent graph
+        await self.intent_graph.add_intent(request)
+
+        # Route the request to appropriate agents
+        agent_path = await self.router.route_request(request)
+
+        if not agent_path:
+            raise CapabilityNotAvailableError(request.task_type)
+
+        request.set_status(RequestStatus.PROCESSING)
+
+        # Process through agent collaboration
+        response = await self.collaborator.process_with_collaboration(
+            request, agent_path
+        )
+
+        # Update context if thread ID is provided
+        if request.context_thread_id:
+            try:
+                await self._update_context_thread(request, response)
+            except Exception as e:
+                self.logger.warning(f"Failed to update context thread: {e}")
+
+        # Propagate learning
+        await self.propagator.propagate_learning(response)
+
+        return response
+
+    async def _fail_request(
+        self,
+        request: Request,
+        error_message: str,
+        start_time: float,
+        status: RequestStatus,
+    ) -> Response:
+        """
+        Mark a request as failed and build its error response.
+
+        Args:
+            request: The request that failed
+            error_message: Description of the failure
+            start_time: perf_counter() value when processing started
+            status: Final status to set on the request
+
+        Returns:
+            Response: Error response for the request
+        """
+        processing_time = time.perf_counter() - start_time
+        request.set_status(status)
+
+        self.logger.error(
+            f"Failed to process request {request.request_id}: {error_message}"
+        )
+
+        # Create error response
+        response = Response.create_error_response(
+            request_id=request.request_id,
+            agent_id="framework",
+            error_message=error_message,
+            processing_time=processing_time,
+        )
+
+        # Still record metrics for failed requests
+        await self.monitor.record_request(request, response, processing_time)
+
+        return response
 
     async def create_context_thread(
         self, user_id: str, initial_context: Optional[Dict[str, Any]] = None
@@ -372,14 +443,12 @@ class AIMFramework:
             1 for agent in self.agents.values() if agent.status == AgentStatus.ACTIVE
         )
 
-        start_time = self.config.get("framework.start_time", time.time())
-
         return {
             "initialized": self.is_initialized,
             "total_agents": len(self.agents),
             "active_agents": active_agents,
             "context_stats": self.context_manager.get_stats(),
-            "uptime": time.time() - start_time,
+            "uptime": time.time() - self.start_time,
         }
 
     async def _update_context_thread(
@@ -435,7 +504,7 @@ class AIMFramework:
             try:
                 await asyncio.wait_for(
                     self._shutdown_event.wait(),
-                    timeout=self.config.get("framework.cleanup_interval", 300.0),
+                    timeout=self.cleanup_interval,
                 )
                 break  # Shutdown event was set
             except asyncio.TimeoutError:
@@ -454,7 +523,7 @@ class AIMFramework:
             try:
                 await asyncio.wait_for(
                     self._shutdown_event.wait(),
-                    timeout=self.config.get("monitoring.collection_interval", 60.0),
+                    timeout=self.monitoring_interval,
                 )
                 break  # Shutdown event was set
             except asyncio.TimeoutError:
@@ -473,7 +542,7 @@ class AIMFramework:
             try:
                 await asyncio.wait_for(
                     self._shutdown_event.wait(),
-                    timeout=self.config.get("scaling.evaluation_interval", 30.0),
+                    timeout=self.scaling_interval,
                 )
                 break  # Shutdown event was set
             except asyncio.TimeoutError:
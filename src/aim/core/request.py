@@ -26,6 +26,9 @@ class RequestStatus(Enum):
     CANCELLED = "cancelled"
 
 
+REQUEST_STATUS_VALUES = {status: status.value for status in RequestStatus}
+
+
 class Priority(Enum):
     """Enumeration of request priorities."""
 
@@ -35,6 +38,9 @@ class Priority(Enum):
     URGENT = "urgent"
 
 
+PRIORITY_VALUES = {priority: priority.value for priority in Priority}
+
+
 @dataclass
 class Request:
     """
@@ -145,12 +151,12 @@ class Request:
             "user_id": self.user_id,
             "content": self.content,
             "task_type": self.task_type,
-            "priority": self.priority.value,
+            "priority": PRIORITY_VALUES[self.priority],
             "timeout": self.timeout,
             "context_thread_id": self.context_thread_id,
             "metadata": self.metadata,
             "created_at": self.created_at,
-            "status": self.status.value,
+            "status": REQUEST_STATUS_VALUES[self.status],
             "agent_path": self.agent_path,
             "age": self.get_age(),
             "expired": self.is_expired(),
@@ -5,12 +5,26 @@ This module contains components for managing knowledge sharing,
 learning propagation, and intent prediction across the agent mesh.
 """
 
-from .capsule import KnowledgeCapsule
-from .intent_graph import IntentGraph
-from .propagator import LearningPropagator
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .capsule import KnowledgeCapsule
+    from .intent_graph import IntentGraph
+    from .propagator import LearningPropagator
+
+# Public names and the submodules defining them, imported on first access
+_LAZY_IMPORTS = {
+    "KnowledgeCapsule": ".capsule",
+    "LearningPropagator": ".propagator",
+    "IntentGraph": ".intent_graph",
+}
 
 __all__ = [
     "KnowledgeCapsule",
     "LearningPropagator",
     "IntentGraph",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_IMPORTS)
@@ -5,10 +5,23 @@ This module contains components for managing system resources,
 including adaptive scaling and performance monitoring.
 """
 
-from .monitor import PerformanceMonitor
-from .scaler import AdaptiveResourceScaler
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .monitor import PerformanceMonitor
+    from .scaler import AdaptiveResourceScaler
+
+# Public names and the submodules defining them, imported on first access
+_LAZY_IMPORTS = {
+    "AdaptiveResourceScaler": ".scaler",
+    "PerformanceMonitor": ".monitor",
+}
 
 __all__ = [
     "AdaptiveResourceScaler",
     "PerformanceMonitor",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_IMPORTS)
@@ -9,7 +9,7 @@ import time
 from collections import defaultdict, deque
 from typing import Any, Dict
 
-from ..core.request import Request, Response
+from ..core.request import PRIORITY_VALUES, Request, Response
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
@@ -55,6 +55,14 @@ class PerformanceMonitor:
 
     async def initialize(self) -> None:
         """Initialize the performance monitor."""
+        try:
+            import psutil
+
+            # Prime the CPU counter so later non-blocking samples have a baseline
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+
         self.logger.info("Performance monitor initialized")
 
     async def shutdown(self) -> None:
@@ -94,7 +102,7 @@ class PerformanceMonitor:
                 "processing_time": processing_time,
                 "confidence": response.confidence,
                 "success": response.success,
-                "priority": request.priority.value,
+                "priority": PRIORITY_VALUES[request.priority],
             }
 
             self.request_metrics.append(metric_record)
@@ -110,8 +118,9 @@ class PerformanceMonitor:
         try:
             import psutil
 
-            # Collect system metrics
-            cpu_usage = psutil.cpu_percent(interval=1)
+            # Collect system metrics; CPU usage is measured since the last call
+            # instead of blocking the event loop for a one-second sample
+            cpu_usage = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage("/")
 
@@ -199,13 +208,22 @@ class PerformanceMonitor:
         current_time = time.time()
         cutoff_time = current_time - time_window
 
-        recent_requests = [
-            metric
-            for metric in self.request_metrics
-            if metric["timestamp"] >= cutoff_time
-        ]
+        request_count = 0
+        total_time = 0.0
+        successful = 0
+
+        # Metrics are appended in time order, so walk back from the newest
+        # record and stop at the first one outside the window
+        for metric in reversed(self.request_metrics):
+            if metric["timestamp"] < cutoff_time:
+                break
 
-        if not recent_requests:
+            request_count += 1
+            total_time += metric["processing_time"]
+            if metric["success"]:
+                successful += 1
+
+        if request_count == 0:
             return {
                 "request_count": 0,
                 "avg_processing_time": 0.0,
@@ -213,14 +231,11 @@ class PerformanceMonitor:
                 "throughput": 0.0,
             }
 
-        total_time = sum(req["processing_time"] for req in recent_requests)
-        successful = sum(1 for req in recent_requests if req["success"])
-
         return {
-            "request_count": len(recent_requests),
-            "avg_processing_time": total_time / len(recent_requests),
-            "success_rate": successful / len(recent_requests),
-            "throughput": len(recent_requests) / time_window,
+            "request_count": request_count,
+            "avg_processing_time": total_time / request_count,
+            "success_rate": successful / request_count,
+            "throughput": request_count / time_window,
         }
 
     async def get_agent_metrics(self, agent_id: str) -> Dict[str, Any]:
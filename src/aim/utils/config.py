@@ -248,8 +248,17 @@ class Config:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        content = json.dumps(self._config, indent=2, sort_keys=True)
+
+        # Leave the file untouched when it already holds this configuration
+        try:
+            if path.read_text(encoding="utf-8") == content:
+                return
+        except (FileNotFoundError, UnicodeDecodeError):
+            pass
+
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(self._config, f, indent=2, sort_keys=True)
+            f.write(content)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
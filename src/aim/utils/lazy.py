@@ -0,0 +1,45 @@
+"""
+Lazy import helpers for the AIM Framework.
+
+This module builds the module-level ``__getattr__`` and ``__dir__`` hooks
+(PEP 562) that let packages defer importing their submodules until a
+public name is first accessed. It only depends on the standard library.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    module_globals: Dict[str, Any], lazy_imports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        module_globals: The package's ``globals()``, used to resolve relative
+            module names and to cache imported values
+        lazy_imports: Mapping of public names to the (relative) modules
+            defining them
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The package's
+        ``__getattr__`` and ``__dir__`` functions
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        """Import a public name from its defining module on first access."""
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """List module attributes including not-yet-imported public names."""
+        return sorted(set(module_globals) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,147 @@
+"""Tests for the AIM REST API server."""
+
+import asyncio
+from typing import Any, Callable, Iterator, List
+
+import pytest
+
+from aim import Agent, AgentCapability, AIMServer, Config, Request, Response
+
+
+class EchoAgent(Agent):
+    """Agent that echoes the request content."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            capabilities={AgentCapability.CODE_GENERATION},
+            description="Echo agent for API server tests",
+        )
+
+    async def process_request(self, request: Request) -> Response:
+        """Echo the request content back."""
+        return Response(
+            request_id=request.request_id,
+            agent_id=self.agent_id,
+            content=f"echo {request.content}",
+            confidence=0.9,
+            success=True,
+        )
+
+
+def _counting(func: Callable[[], Any], calls: List[int]) -> Callable[[], Any]:
+    """Wrap a function so each call is counted in ``calls``."""
+
+    def wrapper() -> Any:
+        calls.append(1)
+        return func()
+
+    return wrapper
+
+
+@pytest.fixture
+def server() -> Iterator[AIMServer]:
+    """Create an initialized server with a single registered agent."""
+    server = AIMServer(Config())
+    server.framework.register_agent(EchoAgent())
+    server.initialize()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def client(server: AIMServer) -> Any:
+    """Create a Flask test client for the server."""
+    return server.app.test_client()
+
+
+def test_list_agents_reuses_cached_body(
+    server: AIMServer, client: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Back-to-back /agents calls serve the same body from one listing."""
+    calls: List[int] = []
+    monkeypatch.setattr(
+        server.framework,
+        "list_agents",
+        _counting(server.framework.list_agents, calls),
+    )
+
+    first = client.get("/agents")
+    second = client.get("/agents")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.data == second.data
+    assert len(calls) == 1
+
+
+def test_list_agents_cache_invalidated_on_registry_change(
+    server: AIMServer, client: Any
+) -> None:
+    """Registering or deregistering an agent invalidates the /agents cache."""
+    (old_agent_id,) = server.framework.agents
+    listed = [agent["agent_id"] for agent in client.get("/agents").json["agents"]]
+    assert listed == [old_agent_id]
+
+    # Swap one agent for another so the agent count stays the same
+    new_agent = EchoAgent()
+    server._call_in_loop(server.framework.deregister_agent, old_agent_id)
+    server._call_in_loop(server.framework.register_agent, new_agent)
+
+    listed = [agent["agent_id"] for agent in client.get("/agents").json["agents"]]
+    assert listed == [new_agent.agent_id]
+
+
+def test_process_request_timeout_returns_504(
+    server: AIMServer, client: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A request that overruns its timeout gets a 504 and is recorded."""
+    route_request = server.framework.router.route_request
+
+    async def slow_route_request(request: Request) -> List[str]:
+        await asyncio.sleep(2.0)
+        return await route_request(request)
+
+    monkeypatch.setattr(server.framework.router, "route_request", slow_route_request)
+
+    response = client.post(
+        "/process",
+        json={
+            "user_id": "user_1",
+            "content": "hello",
+            "task_type": "code_generation",
+            "timeout": 0.2,
+        },
+    )
+
+    assert response.status_code == 504
+    assert response.json["success"] is False
+    assert response.json["error_message"] == "Request timed out after 0.2 seconds"
+
+    metrics = client.get("/metrics").json
+    assert metrics["total_requests"] == 1
+    assert metrics["failed_requests"] == 1
+
+
+def test_process_request_inner_timeout_is_not_request_timeout(
+    server: AIMServer, client: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Timeouts raised before the request deadline are ordinary failures."""
+
+    async def failing_route_request(request: Request) -> List[str]:
+        raise asyncio.TimeoutError("backend timed out")
+
+    monkeypatch.setattr(server.framework.router, "route_request", failing_route_request)
+
+    response = client.post(
+        "/process",
+        json={
+            "user_id": "user_1",
+            "content": "hello",
+            "task_type": "code_generation",
+            "timeout": 5.0,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json["success"] is False
+    assert response.json["error_message"] == "backend timed out"